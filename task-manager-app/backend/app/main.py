@@ -6,8 +6,12 @@ initializes the database, and includes API routes.
 Run with: uvicorn app.main:app --reload --port 8000
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import logging
 
 from app.db import init_db
@@ -20,6 +24,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan handler.
+    
+    Initializes database tables when a worker starts serving,
+    rather than at import time, so importing the module (or
+    forking workers) does not touch the database.
+    """
+    init_db()
+    logger.info("Database initialized")
+    yield
+
+
 # Initialize FastAPI app with metadata
 app = FastAPI(
     title="Task Manager API",
@@ -27,12 +45,10 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson-backed JSON encoding
 )
 
-# Initialize database tables on startup
-init_db()
-logger.info("Database initialized")
-
 # Add CORS middleware to allow frontend requests
 app.add_middleware(
     CORSMiddleware,
@@ -44,6 +60,11 @@ app.add_middleware(
 
 logger.info("CORS middleware added")
 
+# Compress larger responses (e.g. task lists); small payloads are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+logger.info("GZip middleware added")
+
 # Include task routes with /api prefix
 app.include_router(router, prefix="/api", tags=["tasks"])
 
@@ -81,3 +81,26 @@ class TaskResponse(TaskBase):
 
     class Config:
         from_attributes = True  # Allow population from ORM models
+
+
+class TaskListResponse(BaseModel):
+    """Schema for compact task list response (no description).
+    
+    Used for GET /tasks?summary=true responses.
+    Omits the description so list views only read the columns they show.
+    """
+    id: int = Field(..., description="Task unique identifier")
+    title: str = Field(..., description="Task title")
+    completed: bool = Field(..., description="Task completion status")
+
+    class Config:
+        from_attributes = True  # Allow population from ORM models
+
+
+class TaskBulkCreateResponse(BaseModel):
+    """Schema for bulk task creation response.
+    
+    Used for POST /tasks/bulk responses.
+    Only reports the number of created tasks to avoid re-reading them.
+    """
+    created: int = Field(..., description="Number of tasks created")
@@ -1,18 +1,28 @@
 """API routes for task management.
 
 This module defines all CRUD endpoints for the Task resource:
-- GET /tasks - List all tasks
+- GET /tasks - List tasks (keyset paginated)
 - POST /tasks - Create a new task
+- POST /tasks/bulk - Create multiple tasks in one transaction
 - PUT /tasks/{id} - Update a task's status
 - DELETE /tasks/{id} - Delete a task
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.orm import Session, load_only, raiseload
+from typing import List, Union
+import hashlib
 import logging
 
-from app.models import Task as TaskModel, TaskCreate, TaskUpdate, TaskResponse
+from app.models import (
+    Task as TaskModel,
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskListResponse,
+    TaskBulkCreateResponse,
+)
 from app.db import get_db
 
 logger = logging.getLogger(__name__)
@@ -25,23 +35,152 @@ router = APIRouter()
 # ============================================================================
 
 
-@router.get("/tasks", response_model=List[TaskResponse], summary="List all tasks")
-async def get_tasks(db: Session = Depends(get_db)):
-    """Retrieve all tasks from the database.
+def _make_etag(rows) -> str:
+    """Build a weak ETag from the field values of the rows being returned.
+    
+    Hashing the values (rather than e.g. COUNT/MAX(id)) ensures in-place
+    updates such as toggling `completed` also change the tag.
+    """
+    digest = hashlib.blake2b(repr(list(rows)).encode(), digest_size=16)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    # Weak comparison: ignore the W/ prefix on both sides
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    candidates = {opaque(tag) for tag in if_none_match.split(",")}
+    return "*" in candidates or opaque(etag) in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    """Return an empty 304 response carrying the current ETag."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+# Page size bounds for GET /tasks
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# List statements are built once at import with bound parameters, so each
+# request reuses the same statement objects (and their compiled SQL cache
+# entries) instead of rebuilding the query tree.
+# raiseload("*") makes any future relationship access fail loudly instead of
+# lazy-loading per row (N+1); add an explicit selectinload() when needed.
+_LIST_TASKS = (
+    select(TaskModel)
+    .options(raiseload("*"))
+    .where(TaskModel.id > bindparam("after_id"))
+    .order_by(TaskModel.id)
+    .limit(bindparam("limit"))
+)
+_LIST_TASK_SUMMARIES = _LIST_TASKS.options(
+    load_only(TaskModel.id, TaskModel.title, TaskModel.completed)
+)
+
+
+@router.get(
+    "/tasks",
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {
+            "model": Union[List[TaskResponse], List[TaskListResponse]]
+        }
+    },
+    summary="List tasks",
+)
+def get_tasks(
+    request: Request,
+    response: Response,
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum tasks to return"
+    ),
+    after_id: int = Query(
+        0, ge=0, description="Return tasks with an id greater than this (keyset cursor)"
+    ),
+    summary: bool = Query(
+        False, description="Return only id, title and completed for each task"
+    ),
+    db: Session = Depends(get_db),
+):
+    """Retrieve a page of tasks ordered by ID.
+    
+    Uses keyset pagination on the primary key: pass the last id of
+    the previous page as after_id to fetch the next one. Unlike
+    OFFSET, this stays an index range scan at any depth.
+    
+    Rows come straight from the database, so responses are built with
+    model_construct() and no response_model is set: this skips
+    re-validating every task on each request. The schema is still
+    documented through `responses`.
+    
+    With summary=true only the columns needed by a list view are
+    loaded (load_only), so the description is never read or sent.
+    
+    The response carries a weak ETag derived from the page contents;
+    a matching If-None-Match returns 304 with no body.
     
     Args:
+        request (Request): Incoming request (for If-None-Match)
+        response (Response): Outgoing response (for ETag headers)
+        limit (int): Maximum number of tasks to return (1-500)
+        after_id (int): Only return tasks with an ID greater than this
+        summary (bool): Return the compact TaskListResponse shape
         db (Session): Database session (injected by FastAPI)
     
     Returns:
-        List[TaskResponse]: List of all tasks
+        List[TaskResponse] | List[TaskListResponse]: One page of tasks,
+        or an empty 304 response if the client's copy is current
     
     Raises:
         HTTPException: 500 if database query fails
     """
     try:
-        tasks = db.query(TaskModel).all()
-        logger.info(f"Retrieved {len(tasks)} tasks")
-        return tasks
+        params = {"after_id": after_id, "limit": limit}
+        if summary:
+            tasks = db.execute(_LIST_TASK_SUMMARIES, params).scalars().all()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Retrieved %d tasks", len(tasks))
+            etag = _make_etag((t.id, t.title, t.completed) for t in tasks)
+            if _etag_matches(request, etag):
+                return _not_modified(etag)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "no-cache"
+            return [
+                TaskListResponse.model_construct(
+                    id=task.id, title=task.title, completed=task.completed
+                )
+                for task in tasks
+            ]
+
+        tasks = db.execute(_LIST_TASKS, params).scalars().all()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved %d tasks", len(tasks))
+        etag = _make_etag(
+            (t.id, t.title, t.description, t.completed) for t in tasks
+        )
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+        return [
+            TaskResponse.model_construct(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                completed=task.completed,
+            )
+            for task in tasks
+        ]
     except Exception as e:
         logger.error(f"Error fetching tasks: {str(e)}")
         raise HTTPException(
@@ -55,28 +194,46 @@ async def get_tasks(db: Session = Depends(get_db)):
     response_model=TaskResponse,
     summary="Get a single task by ID",
 )
-async def get_task(task_id: int, db: Session = Depends(get_db)):
+def get_task(
+    task_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Retrieve a specific task by its ID.
     
+    The response carries a weak ETag derived from the task's fields;
+    a matching If-None-Match returns 304 with no body.
+    
     Args:
         task_id (int): The task ID to retrieve
+        request (Request): Incoming request (for If-None-Match)
+        response (Response): Outgoing response (for ETag headers)
         db (Session): Database session (injected by FastAPI)
     
     Returns:
-        TaskResponse: The requested task
+        TaskResponse: The requested task, or an empty 304 response
+        if the client's copy is current
     
     Raises:
         HTTPException: 404 if task not found
         HTTPException: 500 if database query fails
     """
     try:
-        task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        task = db.get(TaskModel, task_id, options=[raiseload("*")])
         if not task:
             logger.warning(f"Task {task_id} not found")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Task with id {task_id} not found",
             )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved task %d", task_id)
+        etag = _make_etag([(task.id, task.title, task.description, task.completed)])
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
         return task
     except HTTPException:
         raise
@@ -99,7 +256,7 @@ async def get_task(task_id: int, db: Session = Depends(get_db)):
     status_code=status.HTTP_201_CREATED,
     summary="Create a new task",
 )
-async def create_task(task_data: TaskCreate, db: Session = Depends(get_db)):
+def create_task(task_data: TaskCreate, db: Session = Depends(get_db)):
     """Create a new task in the database.
     
     Args:
@@ -114,18 +271,19 @@ async def create_task(task_data: TaskCreate, db: Session = Depends(get_db)):
         HTTPException: 500 if database operation fails
     """
     try:
-        new_task = TaskModel(
-            title=task_data.title,
-            description=task_data.description,
-            completed=task_data.completed,
-        )
-        db.add(new_task)
-        db.commit()
-        db.refresh(new_task)
-        logger.info(f"Task created with ID: {new_task.id}")
-        return new_task
+        with db.begin():
+            new_task = TaskModel(
+                title=task_data.title,
+                description=task_data.description,
+                completed=task_data.completed,
+            )
+            db.add(new_task)
+            db.flush()  # Assigns the ID without ending the transaction
+            created_task = TaskResponse.model_validate(new_task)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Task created with ID: %d", created_task.id)
+        return created_task
     except Exception as e:
-        db.rollback()
         logger.error(f"Error creating task: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -133,6 +291,51 @@ async def create_task(task_data: TaskCreate, db: Session = Depends(get_db)):
         )
 
 
+# Rows per INSERT statement for bulk creation
+BULK_INSERT_CHUNK_SIZE = 50
+
+
+@router.post(
+    "/tasks/bulk",
+    response_model=TaskBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create multiple tasks at once",
+)
+def create_tasks_bulk(items: List[TaskCreate], db: Session = Depends(get_db)):
+    """Create several tasks in a single transaction.
+    
+    Rows are inserted in chunks of BULK_INSERT_CHUNK_SIZE and committed
+    once, instead of one transaction per task.
+    
+    Args:
+        items (List[TaskCreate]): Tasks to create
+        db (Session): Database session (injected by FastAPI)
+    
+    Returns:
+        TaskBulkCreateResponse: Number of tasks created
+    
+    Raises:
+        HTTPException: 500 if database operation fails
+    """
+    try:
+        payload = [task_data.dict() for task_data in items]
+        with db.begin():
+            for start in range(0, len(payload), BULK_INSERT_CHUNK_SIZE):
+                db.execute(
+                    insert(TaskModel),
+                    payload[start : start + BULK_INSERT_CHUNK_SIZE],
+                )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Bulk created %d tasks", len(payload))
+        return {"created": len(payload)}
+    except Exception as e:
+        logger.error(f"Error bulk creating tasks: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create tasks",
+        )
+
+
 # ============================================================================
 # PUT Endpoint
 # ============================================================================
@@ -143,7 +346,7 @@ async def create_task(task_data: TaskCreate, db: Session = Depends(get_db)):
     response_model=TaskResponse,
     summary="Update a task",
 )
-async def update_task(
+def update_task(
     task_id: int, task_update: TaskUpdate, db: Session = Depends(get_db)
 ):
     """Update an existing task.
@@ -164,27 +367,35 @@ async def update_task(
         HTTPException: 500 if database operation fails
     """
     try:
-        db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-        if not db_task:
-            logger.warning(f"Task {task_id} not found for update")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Task with id {task_id} not found",
-            )
-        
         update_data = task_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_task, field, value)
-        
-        db.add(db_task)
-        db.commit()
-        db.refresh(db_task)
-        logger.info(f"Task {task_id} updated")
-        return db_task
+        with db.begin():
+            if update_data:
+                # Single UPDATE ... RETURNING instead of SELECT-then-UPDATE
+                stmt = (
+                    update(TaskModel)
+                    .where(TaskModel.id == task_id)
+                    .values(**update_data)
+                    .returning(TaskModel)
+                )
+                db_task = db.execute(stmt).scalar_one_or_none()
+            else:
+                db_task = db.get(TaskModel, task_id)
+
+            if not db_task:
+                logger.warning(f"Task {task_id} not found for update")
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Task with id {task_id} not found",
+                )
+
+            # Serialize before commit so the expired instance is not reloaded
+            updated_task = TaskResponse.model_validate(db_task)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Task %d updated", task_id)
+        return updated_task
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
         logger.error(f"Error updating task {task_id}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -202,7 +413,7 @@ async def update_task(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a task",
 )
-async def delete_task(task_id: int, db: Session = Depends(get_db)):
+def delete_task(task_id: int, db: Session = Depends(get_db)):
     """Delete a task from the database.
     
     Args:
@@ -217,21 +428,19 @@ async def delete_task(task_id: int, db: Session = Depends(get_db)):
         HTTPException: 500 if database operation fails
     """
     try:
-        db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-        if not db_task:
-            logger.warning(f"Task {task_id} not found for deletion")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Task with id {task_id} not found",
-            )
-        
-        db.delete(db_task)
-        db.commit()
-        logger.info(f"Task {task_id} deleted")
+        with db.begin():
+            result = db.execute(delete(TaskModel).where(TaskModel.id == task_id))
+            if result.rowcount == 0:
+                logger.warning(f"Task {task_id} not found for deletion")
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Task with id {task_id} not found",
+                )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Task %d deleted", task_id)
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
         logger.error(f"Error deleting task {task_id}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -5,6 +5,7 @@ import TaskForm from '../components/TaskForm';
 import '../styles/Tasks.css';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
+const TASKS_PAGE_SIZE = 500;
 
 function Tasks() {
     const [tasks, setTasks] = useState([]);
@@ -18,8 +19,18 @@ function Tasks() {
     const fetchTasks = async () => {
         try {
             setLoading(true);
-            const response = await axios.get(`${API_BASE_URL}/api/tasks`);
-            setTasks(response.data);
+            // The list endpoint is paginated by id; follow pages until a short one
+            const allTasks = [];
+            let afterId = 0;
+            while (true) {
+                const response = await axios.get(`${API_BASE_URL}/api/tasks`, {
+                    params: { limit: TASKS_PAGE_SIZE, after_id: afterId },
+                });
+                allTasks.push(...response.data);
+                if (response.data.length < TASKS_PAGE_SIZE) break;
+                afterId = response.data[response.data.length - 1].id;
+            }
+            setTasks(allTasks);
             setError(null);
         } catch (err) {
             setError('Failed to fetch tasks');